@@ -1,24 +1,60 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
 import logging
 import re
-import xml.etree.ElementTree as ET
 from datetime import timedelta
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, MI5_RSS_URL, GOVUK_URL, LEVEL_TO_NUMBER
+from .const import DOMAIN, MI5_RSS_URL, GOVUK_URL, LEVELS
 
 _LOGGER = logging.getLogger(__name__)
 
-# Threat level words (we’ll search for these in MI5 RSS <title> text and GOV.UK HTML)
-RE_LEVEL_WORD = re.compile(r"\b(LOW|MODERATE|SUBSTANTIAL|SEVERE|CRITICAL)\b", re.IGNORECASE)
+# Request headers that reduce 403/WAF blocking; built once and shared by every fetch
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-GB,en;q=0.9",
+    # aiohttp decompresses these transparently; "br" is left out as it needs the optional Brotli package
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+_TIMEOUT = aiohttp.ClientTimeout(total=20)
+
+# The GOV.UK page is decoded in chunks so reading can stop at the first match; each re-scan starts
+# this many characters before the new chunk so a match split across a chunk boundary is still found.
+_STREAM_CHUNK = 4096
+_STREAM_OVERLAP = 256
+
+# The national threat level changes rarely, so poll slowly. After a failure, retry sooner and
+# back off (1h -> 2h -> 4h -> 6h) until back at the normal interval.
+_UPDATE_INTERVAL = timedelta(hours=6)
+_RETRY_INTERVAL = timedelta(hours=1)
+
+# Last good result and its validators are persisted so a restart doesn't wait on the network
+_STORAGE_VERSION = 1
+_STORAGE_KEY = f"{DOMAIN}.cache"
+_SAVE_DELAY = 1
+
+# One capture group per level, in LEVELS order, so `m.lastindex` is the level number
+_LEVEL_GROUPS = "(?:" + "|".join(f"({level})" for level in LEVELS) + ")"
+
+# Threat level words (we’ll search for these in the MI5 RSS feed and GOV.UK HTML)
+RE_LEVEL_WORD = re.compile(rf"\b{_LEVEL_GROUPS}\b", re.IGNORECASE)
 
 # GOV.UK typically uses a phrase like: "... from terrorism is substantial."
-RE_GOVUK_PHRASE = re.compile(r"from terrorism is\s+(low|moderate|substantial|severe|critical)\b", re.IGNORECASE)
+RE_GOVUK_PHRASE = re.compile(rf"from terrorism is\s+{_LEVEL_GROUPS}\b", re.IGNORECASE)
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -31,7 +67,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the integration from the UI (config flow)."""
     hass.data.setdefault(DOMAIN, {})
     coordinator = UKThreatLevelCoordinator(hass)
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_load_cache():
+        # Sensors start from the persisted level; refresh from the network in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), name=f"{DOMAIN} refresh {entry.entry_id}"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
@@ -46,83 +88,192 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted cache so a re-added entry doesn't restore a stale level."""
+    await Store(hass, _STORAGE_VERSION, _STORAGE_KEY).async_remove()
+
+
 class UKThreatLevelCoordinator(DataUpdateCoordinator[dict]):
     def __init__(self, hass: HomeAssistant) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name="UK Threat Level",
-            update_interval=timedelta(minutes=30),
+            update_interval=_UPDATE_INTERVAL,
         )
+        self._failures = 0
+        self._store = Store(hass, _STORAGE_VERSION, _STORAGE_KEY)
+        # Per-URL validators and the result parsed from that response, for conditional GETs
+        self._etag: dict[str, str] = {}
+        self._last_modified: dict[str, str] = {}
+        self._last_result: dict[str, dict] = {}
 
-    async def _fetch_text(self, url: str) -> str:
-        """Fetch text with headers that reduce 403/WAF blocking."""
-        session = async_get_clientsession(self.hass)
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-GB,en;q=0.9",
-        }
-
-        resp = await session.get(url, headers=headers, allow_redirects=True, timeout=20)
+    async def async_load_cache(self) -> bool:
+        """Restore the last persisted result into `data`; returns False if there is none."""
+        cached = await self._store.async_load()
+        if not cached or not cached.get("data"):
+            return False
 
-        if resp.status == 403:
-            # Keep message short; body can be huge / binary / blocked page
-            raise UpdateFailed(f"403 Forbidden from {url} (likely WAF/User-Agent filtering)")
+        self._etag.update(cached.get("etag", {}))
+        self._last_modified.update(cached.get("last_modified", {}))
+        self._last_result.update(cached.get("last_result", {}))
+        self.data = cached["data"]
+        return True
 
-        resp.raise_for_status()
-        return await resp.text()
-
-    def _normalize_level(self, text: str) -> str | None:
-        m = RE_LEVEL_WORD.search(text or "")
-        return m.group(1).upper() if m else None
+    def _cache_data(self, data: dict) -> dict:
+        return {
+            "data": data,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "last_result": self._last_result,
+        }
 
-    def _parse_mi5_rss_level(self, xml_text: str) -> str | None:
+    async def _fetch_text(
+        self, url: str, stop: re.Pattern[str] | None = None
+    ) -> tuple[int, str, re.Match[str] | None, str | None, str | None]:
         """
-        MI5 XML feed is RSS-like; we scan <title> elements for the level word.
-        Example titles often include "Current threat level: SUBSTANTIAL"
+        Fetch text with headers that reduce 403/WAF blocking.
+        Returns (status, text, match, etag, last_modified); text is empty on 304 Not Modified.
+        If `stop` is given, reading ends as soon as it matches and `match` is that match (None if
+        the body never matched), so text may be only the prefix of the body containing it.
+        Stopping before EOF means aiohttp closes that connection instead of pooling it.
         """
+        headers = _HEADERS
+        # Only revalidate when we still hold the result parsed from the cached response
+        if url in self._last_result:
+            headers = dict(_HEADERS)
+            if url in self._etag:
+                headers["If-None-Match"] = self._etag[url]
+            if url in self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified[url]
+
+        session = async_get_clientsession(self.hass)
+        # Context manager releases the connection back to the shared pool on every exit path
+        async with session.get(url, headers=headers, allow_redirects=True, timeout=_TIMEOUT) as resp:
+            if resp.status == 403:
+                # Keep message short; body can be huge / binary / blocked page
+                raise UpdateFailed(f"403 Forbidden from {url} (likely WAF/User-Agent filtering)")
+
+            resp.raise_for_status()
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if resp.status == 304:
+                return resp.status, "", None, etag, last_modified
+            if stop is None:
+                return resp.status, await resp.text(), None, etag, last_modified
+            m = await self._read_until(resp, stop)
+            return resp.status, m.string if m else "", m, etag, last_modified
+
+    async def _read_until(
+        self, resp: aiohttp.ClientResponse, stop: re.Pattern[str]
+    ) -> re.Match[str] | None:
+        """Decode the body incrementally, returning the first `stop` match as soon as it's seen."""
         try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError:
-            return None
+            decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
-        for title_el in root.findall(".//title"):
-            if title_el.text:
-                lvl = self._normalize_level(title_el.text)
-                if lvl:
-                    return lvl
-        return None
+        text = ""
+        scan_from = 0
+        async for chunk in resp.content.iter_chunked(_STREAM_CHUNK):
+            scan_from = max(0, len(text) - _STREAM_OVERLAP)
+            text += decoder.decode(chunk)
+            m = stop.search(text, scan_from)
+            # A match touching the end of the buffer could still change (e.g. "low" -> "lower")
+            if m and m.end() < len(text):
+                return m
+        # At EOF a match may end exactly at the end of the body
+        text += decoder.decode(b"", final=True)
+        return stop.search(text, scan_from)
 
-    def _parse_govuk_level(self, html_text: str) -> str | None:
-        """
-        GOV.UK page usually includes: "The threat to the UK ... from terrorism is substantial."
-        """
-        m = RE_GOVUK_PHRASE.search(html_text or "")
-        if not m:
+    def _remember(self, url: str, etag: str | None, last_modified: str | None, result: dict) -> dict:
+        """Cache a successfully parsed result with the validators of the response it came from."""
+        self._last_result[url] = result
+        for cache, value in ((self._etag, etag), (self._last_modified, last_modified)):
+            if value:
+                cache[url] = value
+            else:
+                cache.pop(url, None)
+        return result
+
+    def _find_level(self, text: str) -> tuple[str, int] | None:
+        """Find the first whole-word level in text; returns (level, number)."""
+        if not text:
             return None
-        return self._normalize_level(m.group(1))
+        m = RE_LEVEL_WORD.search(text)
+        return (LEVELS[m.lastindex - 1], m.lastindex) if m else None
+
+    async def _async_fetch_mi5(self) -> dict:
+        status, xml_text, _, etag, last_modified = await self._fetch_text(MI5_RSS_URL)
+        if status == 304:
+            return self._last_result[MI5_RSS_URL]
+        # The feed is tiny, so scan the raw text rather than parsing XML; a <title>-only scan
+        # could never find a level that a scan of the whole document misses.
+        parsed = self._find_level(xml_text)
+        if parsed:
+            level, number = parsed
+            return self._remember(
+                MI5_RSS_URL,
+                etag,
+                last_modified,
+                {"level": level, "number": number, "source": MI5_RSS_URL},
+            )
+        raise UpdateFailed("MI5 RSS fetched but could not parse a known level")
+
+    async def _async_fetch_govuk(self) -> dict:
+        # The page is much larger than the feed and the phrase is near the top, so stop reading
+        # there; that costs reuse of this one connection, which a 6h poll rarely gets anyway.
+        status, _, m, etag, last_modified = await self._fetch_text(GOVUK_URL, RE_GOVUK_PHRASE)
+        if status == 304:
+            return self._last_result[GOVUK_URL]
+        # A body that never matched while streaming (WAF/error pages) fails without another scan
+        if m is None:
+            raise UpdateFailed("Fetched GOV.UK but could not parse a known level")
+        # The phrase pattern already captured the level word; its group index is the number
+        return self._remember(
+            GOVUK_URL,
+            etag,
+            last_modified,
+            {"level": LEVELS[m.lastindex - 1], "number": m.lastindex, "source": GOVUK_URL},
+        )
 
     async def _async_update_data(self) -> dict:
-        # 1) Try MI5 RSS/XML feed first
         try:
-            xml_text = await self._fetch_text(MI5_RSS_URL)
-            level = self._parse_mi5_rss_level(xml_text)
-            if level and level in LEVEL_TO_NUMBER:
-                return {"level": level, "number": LEVEL_TO_NUMBER[level], "source": MI5_RSS_URL}
-            _LOGGER.warning("MI5 RSS fetched but could not parse a known level; falling back to GOV.UK")
-        except Exception as err:
-            _LOGGER.warning("MI5 RSS fetch/parse failed (%s); falling back to GOV.UK", err)
-
-        # 2) Fallback to GOV.UK
+            result = await self._async_fetch_level()
+        except UpdateFailed as err:
+            self._failures += 1
+            self.update_interval = min(_RETRY_INTERVAL * 2 ** (self._failures - 1), _UPDATE_INTERVAL)
+            if not self.data:
+                raise
+            # The level changes rarely, so a stale value beats an unavailable sensor
+            _LOGGER.warning("Update failed (%s); keeping last known level", err)
+            return self.data
+
+        self._failures = 0
+        self.update_interval = _UPDATE_INTERVAL
+        self._store.async_delay_save(lambda: self._cache_data(result), _SAVE_DELAY)
+        return result
+
+    async def _async_fetch_level(self) -> dict:
+        # Fetch both sources concurrently so a slow/blocked MI5 doesn't add its latency to the
+        # fallback; GOV.UK is cancelled as soon as MI5 succeeds.
+        mi5_task = asyncio.create_task(self._async_fetch_mi5())
+        govuk_task = asyncio.create_task(self._async_fetch_govuk())
         try:
-            html_text = await self._fetch_text(GOVUK_URL)
-            level = self._parse_govuk_level(html_text)
-            if level and level in LEVEL_TO_NUMBER:
-                return {"level": level, "number": LEVEL_TO_NUMBER[level], "source": GOVUK_URL}
-            raise UpdateFailed("Fetched GOV.UK but could not parse a known level")
-        except Exception as err:
-            raise UpdateFailed(f"All sources failed: {err}") from err
+            # 1) Prefer the MI5 RSS/XML feed
+            try:
+                return await mi5_task
+            except Exception as err:
+                _LOGGER.warning("MI5 RSS fetch/parse failed (%s); falling back to GOV.UK", err)
+
+            # 2) Fallback to GOV.UK
+            try:
+                return await govuk_task
+            except Exception as err:
+                raise UpdateFailed(f"All sources failed: {err}") from err
+        finally:
+            if not govuk_task.done():
+                govuk_task.cancel()
+            elif not govuk_task.cancelled():
+                # Mark an unused fallback failure as retrieved so asyncio doesn't log it
+                govuk_task.exception()
@@ -4,4 +4,7 @@ from .const import DOMAIN
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     async def async_step_user(self, user_input=None):
+        # Single instance: the sensors and the persisted cache are not per-entry
+        await self.async_set_unique_id(DOMAIN)
+        self._abort_if_unique_id_configured()
         return self.async_create_entry(title="UK Threat Level", data={})
@@ -3,10 +3,7 @@ DOMAIN = "uk_threat_level"
 MI5_RSS_URL = "https://www.mi5.gov.uk/UKThreatLevel/UKThreatLevel.xml"
 GOVUK_URL = "https://www.gov.uk/terrorism-national-emergency"
 
-LEVEL_TO_NUMBER = {
-    "LOW": 1,
-    "MODERATE": 2,
-    "SUBSTANTIAL": 3,
-    "SEVERE": 4,
-    "CRITICAL": 5,
-}
+# Ordered lowest to highest; a level's number is its 1-based position
+LEVELS = ("LOW", "MODERATE", "SUBSTANTIAL", "SEVERE", "CRITICAL")
+
+LEVEL_TO_NUMBER = {level: number for number, level in enumerate(LEVELS, start=1)}
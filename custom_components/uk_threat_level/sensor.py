@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from abc import abstractmethod
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -21,6 +23,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 class _Base(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
+    _key: str
+
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
+        self._update_from_data()
+
+    @abstractmethod
+    def _build_attrs(self, data: dict) -> dict:
+        """Return the extra state attributes for this sensor from coordinator data."""
+
+    def _update_from_data(self) -> None:
+        # Materialise state once per refresh; HA reads these attributes many times per update
+        data = self.coordinator.data or {}
+        self._attr_native_value = data.get(self._key)
+        self._attr_extra_state_attributes = self._build_attrs(data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -35,16 +57,12 @@ class UKThreatLevelTextSensor(_Base):
     _attr_name = "Threat level"
     _attr_unique_id = f"{DOMAIN}_level"
     _attr_icon = "mdi:shield-alert-outline"
+    _key = "level"
 
-    @property
-    def native_value(self):
-        return self.coordinator.data.get("level")
-
-    @property
-    def extra_state_attributes(self):
+    def _build_attrs(self, data: dict) -> dict:
         return {
-            "source": self.coordinator.data.get("source"),
-            "gauge_value": self.coordinator.data.get("number"),
+            "source": data.get("source"),
+            "gauge_value": data.get("number"),
         }
 
 
@@ -53,14 +71,10 @@ class UKThreatLevelNumberSensor(_Base):
     _attr_unique_id = f"{DOMAIN}_number"
     _attr_native_unit_of_measurement = "level"
     _attr_icon = "mdi:gauge"
+    _key = "number"
 
-    @property
-    def native_value(self):
-        return self.coordinator.data.get("number")
-
-    @property
-    def extra_state_attributes(self):
+    def _build_attrs(self, data: dict) -> dict:
         return {
-            "label": self.coordinator.data.get("level"),
-            "source": self.coordinator.data.get("source"),
+            "label": data.get("level"),
+            "source": data.get("source"),
         }